@@ -0,0 +1,161 @@
+"""On-disk cache for slowly changing Integrated Water Level System API responses."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from aiohttp import ClientError, ClientSession
+from orjson import loads as json_loads
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Union
+
+from .const import HTTP_NOT_MODIFIED, HTTP_OK
+
+CACHE_TTL: int = 86400
+
+LOG = logging.getLogger(__name__)
+
+_INFLIGHT: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+
+def cache_dir() -> Path:
+    """ Return the directory used to store cached API responses """
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "chstides"
+
+
+def cache_path_for(url: str) -> Path:
+    """ Return the cache file for an API URL """
+
+    return cache_dir() / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _read_meta(cache_path: Path) -> dict:
+    """ Return the validators stored next to a cache file, or {} if unavailable """
+
+    try:
+        return json.loads(Path(str(cache_path) + ".meta").read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _read_cache(cache_path: Path):
+    """ Return the cached (body, meta) pair, or (None, {}) if unavailable """
+
+    meta = _read_meta(cache_path)
+    if not meta:
+        return None, {}
+    try:
+        body = cache_path.read_bytes()
+    except OSError:
+        return None, {}
+    return body, meta
+
+
+def _write_atomic(path: Path, content: bytes):
+    """ Write content so readers never see a partially written file """
+
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(content)
+        os.replace(tmp, str(path))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _write_cache(cache_path: Path, body: Optional[bytes], meta: dict):
+    """ Store the response body and its validators """
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if body is not None:
+            _write_atomic(cache_path, body)
+        _write_atomic(Path(str(cache_path) + ".meta"), json.dumps(meta).encode("utf-8"))
+    except OSError as err:
+        LOG.debug("Unable to write cache %s: %s", cache_path, err)
+
+
+async def single_flight(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """ Share one in-flight fetch between concurrent callers asking for the same key """
+
+    key = (asyncio.get_running_loop(), key)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # shield so that one caller being cancelled does not cancel the others
+    return await asyncio.shield(task)
+
+
+async def _cached_body(session: ClientSession, url: str, cache_path: Path, ttl: int) -> Optional[bytes]:
+    """ Return the response body for an API URL, revalidating a disk copy with ETag/Last-Modified
+
+    A stale disk copy is returned when the API cannot be reached or answers with an
+    error, since the cached endpoints change on the order of months.
+    """
+
+    # file access runs in the default executor so it never blocks the event loop
+    loop = asyncio.get_running_loop()
+    cached, meta = await loop.run_in_executor(None, _read_cache, cache_path)
+    if cached is not None and time.time() - meta.get("fetched", 0) < ttl:
+        return cached
+
+    headers = {}
+    if cached is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status == HTTP_NOT_MODIFIED and cached is not None:
+                body = None
+            elif response.status != HTTP_OK or response.content_type != 'application/json':
+                return cached
+            else:
+                body = await response.read()
+    except (ClientError, asyncio.TimeoutError) as err:
+        if cached is None:
+            raise
+        LOG.debug("Using stale cache for %s: %s", url, err)
+        return cached
+
+    if body is None:
+        meta["fetched"] = time.time()
+        await loop.run_in_executor(None, _write_cache, cache_path, None, meta)
+        return cached
+
+    await loop.run_in_executor(None, _write_cache, cache_path, body, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched": time.time(),
+    })
+
+    return body
+
+
+async def cached_json(
+    session: ClientSession,
+    url: str,
+    cache_path: Optional[Union[str, Path]] = None,
+    ttl: int = CACHE_TTL,
+) -> Any:
+    """ Retreive JSON from an API URL, revalidating a disk copy with ETag/Last-Modified """
+
+    cache_path = Path(cache_path) if cache_path is not None else cache_path_for(url)
+    body = await single_flight(
+        ("cached_json", url), lambda: _cached_body(session, url, cache_path, ttl)
+    )
+    if body is None:
+        return '0'
+
+    return json_loads(body)
@@ -1,13 +1,17 @@
+import asyncio
 import logging
 import json
-import re
+import time
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from datetime import datetime, timedelta
-from geopy import distance
-from typing import Any, Dict, Union
+from math import cos, radians, sin
+from operator import itemgetter
+from orjson import loads as json_loads
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 import voluptuous as vol
 
+from .cache import CACHE_TTL, cached_json, single_flight
 from .const import (
     ENDPOINT,
     ENDPOINT_STATION,
@@ -22,6 +26,8 @@ from .const import (
     ENDPOINT_PHENOMENON,
     ENDPOINT_TIDE_TABLE,
     ENDPOINT_TIDE_TABLES,
+    HTTP_NOT_MODIFIED,
+    HTTP_OK,
     URLS,
 )
 
@@ -29,14 +35,54 @@ M2FT : float = 3.28084
 
 LOG = logging.getLogger(__name__)
 
-__all__ = ["TideData"]
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
+
+TIME_SERIES_CODES = frozenset(['wlo','wlp','wlp-hilo','wlp-bores','wcp-slack','wlf','wlf-spine','dvcf-spine'])
+
+def _format_date(value):
+    """Format a from/to datetime for the API."""
+    return value.strftime(DATE_FORMAT)
+
+def _time_series_code(value):
+    """Drop time series codes the API does not know."""
+    return value if value in TIME_SERIES_CODES else None
+
+_PARAM_HANDLERS = {
+    'from': _format_date,
+    'to': _format_date,
+    'time-series-code': _time_series_code,
+}
+
+STATION_DATA_PARAMS = frozenset(['time-series-code','from','to'])
+STATIONS_PARAMS = frozenset(['code','chs-region-code','time-series-code'])
+TIDE_TABLES_PARAMS = frozenset(['type','parent-tide-table-id'])
+MONTHLY_MEAN_PARAMS = frozenset(['year','month'])
+
+_SESSION: Optional[ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SESSION_CLOSER: Optional[AsyncGenerator[None, None]] = None
+
+_URL_TEMPLATES = {arg: (ENDPOINT + url).format_map for arg, url in URLS.items()}
+
+_STATIONS_SOA: Optional[Tuple[List[float], List[float], List[float], List[str]]] = None
+_STATIONS_SOA_TIME: float = 0.0
+
+_NEAREST_CACHE: Dict[Tuple[float, float], str] = {}
+
+REFERENCE_TTL: int = 86400
+
+_REF_CACHE: Dict[Any, Tuple[float, bytes]] = {}
+
+__all__ = ["TideData", "get_session", "close_session"]
 
 
 def validate_station_id(station_id):
     """Check that the station id is well-formed."""
     if station_id is None:
         return
-    if not re.fullmatch(r"[0-9a-f]{24}", station_id):
+    if not isinstance(station_id, str) or len(station_id) != 24 or not _HEX_DIGITS.issuperset(station_id):
         raise vol.Invalid('Station ID must be a 24 character hexidecimal')
     return station_id
 
@@ -45,90 +91,321 @@ def validate_station_code(station_code):
     """Check that the station code is well-formed."""
     if station_code is None:
         return
-    if not re.fullmatch(r"\d{5}", station_code):
+    if not isinstance(station_code, str) or len(station_code) != 5 or not station_code.isdecimal():
         raise vol.Invalid('Station Code must be of the form "#####"')
     return station_code
 
-async def get_stations():
-    """Get list of all sites from The Canadian Hydrographic Service (CHS), for auto-config."""
+INIT_SCHEMA = vol.Schema(
+    vol.All(
+        {
+            vol.Required(
+                vol.Any("station_id", "station_code", "coordinates"),
+                msg="Must specify either 'station id', 'station code' or 'corrdinates'",
+            ): object,
+            vol.Optional("measurement"): object,
+            vol.Optional("language"): object,
+            vol.Optional("session"): object,
+        },
+        {
+            vol.Optional("station_id"):validate_station_id,
+            vol.Optional("station_code"):validate_station_code,
+            vol.Optional("coordinates"): (
+                vol.All(vol.Or(int,float), vol.Range(-90,90)),
+                vol.All(vol.Or(int,float), vol.Range(-180,180)),
+            ),
+            vol.Optional("measurement", default="m"): vol.In(
+                ["m", "ft"]
+            ),
+            vol.Optional("language", default="english"): vol.In(
+                ["english", "french"]
+            ),
+            vol.Optional("session", default=None): vol.Any(None, ClientSession),
+        },
+    )
+)
 
-    async with ClientSession() as session:
-        response = await session.get(
-            ENDPOINT + ENDPOINT_STATIONS, timeout=10
-        )
-        station_json = await response.json()
+def create_session():
+    """ Create a ClientSession that keeps connections to the API alive """
+
+    return ClientSession(
+        connector=TCPConnector(limit_per_host=8, ttl_dns_cache=600, keepalive_timeout=75),
+        timeout=ClientTimeout(total=10, connect=3, sock_read=5),
+    )
+
+async def _close_with_loop(session):
+    """ Close a session when its event loop shuts down its async generators """
+
+    try:
+        yield
+    finally:
         await session.close()
 
-    return station_json
+def _discard_session(session, loop):
+    """ Close a session created in another event loop, where that is still possible """
 
-async def closest_station(lat, lon):
+    if session.closed:
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        LOG.warning(
+            "Discarding a ClientSession left open by a finished event loop; "
+            "await close_session() before the loop ends"
+        )
+
+def _open_session():
+    """ Create a session, and the generator that closes it when its event loop shuts down """
+
+    session = create_session()
+    # start the generator so the loop finalizes it, and closes the session, on shutdown
+    closer = _close_with_loop(session)
+    try:
+        closer.__anext__().send(None)
+    except StopIteration:
+        pass
+    return session, closer
+
+def get_session():
+    """ Return the process-wide ClientSession used by the module-level helpers
+
+    The session belongs to the running event loop. It is closed when that loop
+    shuts down its async generators, as asyncio.run() does on exit; loops run by
+    hand should await close_session() before they are closed.
+    """
+
+    global _SESSION, _SESSION_LOOP, _SESSION_CLOSER
+
+    # a session cannot be used outside the event loop it was created in
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        if _SESSION is not None:
+            _discard_session(_SESSION, _SESSION_LOOP)
+        _SESSION, _SESSION_CLOSER = _open_session()
+        _SESSION_LOOP = loop
+    return _SESSION
+
+async def close_session():
+    """ Close the process-wide ClientSession """
+
+    global _SESSION, _SESSION_LOOP, _SESSION_CLOSER
+
+    if _SESSION is not None:
+        if _SESSION_LOOP is asyncio.get_running_loop():
+            await _SESSION.close()
+            await _SESSION_CLOSER.aclose()
+        else:
+            _discard_session(_SESSION, _SESSION_LOOP)
+        _SESSION = None
+        _SESSION_LOOP = None
+        _SESSION_CLOSER = None
+
+async def get_stations(session: Optional[ClientSession] = None):
+    """Get list of all sites from The Canadian Hydrographic Service (CHS), for auto-config."""
+
+    if session is None:
+        session = get_session()
+
+    return await cached_json(session, ENDPOINT + ENDPOINT_STATIONS)
+
+def _unit_vector(lat, lon):
+    """Return the point on the unit sphere for a latitude/longitude in degrees."""
+
+    lat = radians(lat)
+    lon = radians(lon)
+    cos_lat = cos(lat)
+    return cos_lat * cos(lon), cos_lat * sin(lon), sin(lat)
+
+async def station_coordinates(session: Optional[ClientSession] = None):
+    """Return the station ids with their positions as x, y, z lists on the unit sphere."""
+
+    global _STATIONS_SOA, _STATIONS_SOA_TIME
+
+    if _STATIONS_SOA is None or time.monotonic() - _STATIONS_SOA_TIME >= CACHE_TTL:
+        station_list = await get_stations(session)
+        id_arr = []
+        x_arr = []
+        y_arr = []
+        z_arr = []
+        # keep only the fields needed to find the closest station
+        for station in station_list:
+            x, y, z = _unit_vector(station["latitude"], station["longitude"])
+            id_arr.append(station["id"])
+            x_arr.append(x)
+            y_arr.append(y)
+            z_arr.append(z)
+        _STATIONS_SOA = (x_arr, y_arr, z_arr, id_arr)
+        _STATIONS_SOA_TIME = time.monotonic()
+        # answers computed against the previous catalogue may be stale
+        _NEAREST_CACHE.clear()
+
+    return _STATIONS_SOA
+
+def _nearest_idx(x, y, z, x_arr, y_arr, z_arr) -> int:
+    """Return the index of the unit vector nearest to x/y/z."""
+
+    best_idx = 0
+    best_d2 = float("inf")
+    for i in range(len(x_arr)):
+        # the chord length is monotonic in great-circle distance, so no trig is needed
+        dx = x_arr[i] - x
+        dy = y_arr[i] - y
+        dz = z_arr[i] - z
+        d2 = dx * dx + dy * dy + dz * dz
+        if d2 < best_d2:
+            best_d2 = d2
+            best_idx = i
+    return best_idx
+
+async def closest_station(lat, lon, session: Optional[ClientSession] = None):
     """Return the id of the closest station to our lat/lon."""
-    
-    station_list = await get_stations()
 
-    def station_distance(station):
-        return distance.distance((lat,lon), (station["latitude"], station["longitude"]))
+    # keyed on the exact point, since nearby harbour stations can be well under 1 km apart
+    key = (lat, lon)
+    station_id = None
+    if time.monotonic() - _STATIONS_SOA_TIME < CACHE_TTL:
+        station_id = _NEAREST_CACHE.get(key)
+    if station_id is None:
+        x_arr, y_arr, z_arr, id_arr = await station_coordinates(session)
+        station_id = id_arr[_nearest_idx(*_unit_vector(lat, lon), x_arr, y_arr, z_arr)]
+        _NEAREST_CACHE[key] = station_id
 
-    closest = min(station_list, key=station_distance)
+    return station_id
 
-    return closest["id"]
+def _params_key(params):
+    """ Return a hashable form of the query parameters """
+
+    return tuple(sorted(params.items())) if params else ()
+
+async def _fetch_body(url, session, params, http_cache):
+    """ Return the (status, body) of an API URL, with a None body if the response is not JSON
+
+    Only HTTP 200 responses are stored in http_cache, so error bodies are never revalidated.
+    """
+
+    cache_key = (url, _params_key(params))
+    cached = http_cache.get(cache_key) if http_cache is not None else None
+    headers = {}
+    if cached is not None:
+        if cached[0]:
+            headers["If-None-Match"] = cached[0]
+        if cached[1]:
+            headers["If-Modified-Since"] = cached[1]
+
+    async with session.get(url, params=params, headers=headers) as response:
+        if response.status == HTTP_NOT_MODIFIED and cached is not None:
+            return HTTP_OK, cached[2]
+        if response.content_type != 'application/json':
+            return response.status, None
+        body = await response.read()
+
+    if http_cache is not None and response.status == HTTP_OK:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            http_cache[cache_key] = (etag, last_modified, body)
+
+    return response.status, body
+
+async def get_data(
+    url,
+    session: Optional[ClientSession] = None,
+    params: Optional[Dict[str, str]] = None,
+    http_cache: Optional[Dict[Any, Tuple[Optional[str], Optional[str], bytes]]] = None,
+):
+    """ Retreive data from Integrated Water Level System API URL
+
+    When an http_cache dict is given, responses carrying an ETag or Last-Modified
+    header are stored in it and later requests for the same URL are conditional.
+    Concurrent requests for the same URL share one HTTP request unless they ask
+    for a from/to time window.
+    """
+
+    if session is None:
+        session = get_session()
+
+    if params and ("from" in params or "to" in params):
+        _, body = await _fetch_body(url, session, params, http_cache)
+    else:
+        _, body = await single_flight(
+            ("get_data", url, _params_key(params)),
+            lambda: _fetch_body(url, session, params, http_cache),
+        )
+    if body is None:
+        return '0'
 
-async def get_data(url):
-    """ Retreive data from Integrated Water Level System API URL """
+    # every caller gets its own parsed copy, since callers mutate the result
+    return json_loads(body)
 
-    async with ClientSession() as session:
-        response = await session.get(url)
-        headers = response.headers
-        if headers.get('content-type') == 'application/json':
-            data = await response.json()
-        else:
-            data = '0'   
-        await session.close()
+async def get_reference_data(url, session: Optional[ClientSession] = None, params: Optional[Dict[str, str]] = None):
+    """ Retreive static reference data, reusing the response for a day within the process """
 
-    return data
+    key = (url, _params_key(params))
+    cached = _REF_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < REFERENCE_TTL:
+        return json_loads(cached[1])
 
-class TideData(object):
+    if session is None:
+        session = get_session()
+
+    status, body = await single_flight(
+        ("get_data",) + key, lambda: _fetch_body(url, session, params, None)
+    )
+    if body is None:
+        return '0'
+    # an error body must not stand in for the reference data for a whole day
+    if status == HTTP_OK:
+        _REF_CACHE[key] = (time.monotonic(), body)
+
+    return json_loads(body)
+
+class TideData:
     """Main class for The Canadian Hydrographic Service (CHS) Integrated Water Level System API requests."""
 
+    __slots__ = (
+        "station_id",
+        "station_code",
+        "coordinates",
+        "language",
+        "measurement",
+        "station_information",
+        "conditions",
+        "_session",
+        "_owns_session",
+        "_session_loop",
+        "_session_closer",
+        "_id_lock",
+        "_http_cache",
+        "_timeseries_codes",
+        "_name_key",
+        "_tide_labels",
+    )
+
     def __init__(self, **kwargs):
         """Initialize the data object"""
 
-        init_schema = vol.Schema(
-            vol.All(
-                {
-                    vol.Required(
-                        vol.Any("station_id", "station_code", "coordinates"),
-                        msg="Must specify either 'station id', 'station code' or 'corrdinates'",
-                    ): object,
-                    vol.Optional("measurement"): object,
-                    vol.Optional("language"): object,
-                },
-                {
-                    vol.Optional("station_id"):validate_station_id,
-                    vol.Optional("station_code"):validate_station_code,
-                    vol.Optional("coordinates"): (
-                        vol.All(vol.Or(int,float), vol.Range(-90,90)),
-                        vol.All(vol.Or(int,float), vol.Range(-180,180)),
-                    ),
-                    vol.Optional("measurement", default="m"): vol.In(
-                        ["m", "ft"]
-                    ),
-                    vol.Optional("language", default="english"): vol.In(
-                        ["english", "french"]
-                    ),
-                },
-            )
-        )
-
-        kwargs = init_schema(kwargs)
+        kwargs = INIT_SCHEMA(kwargs)
 
         self.station_id = None
         self.station_code = None
         self.coordinates = None
         self.language = kwargs["language"]
         self.measurement = kwargs["measurement"]
+        if self.language == "english":
+            self._name_key = "nameEn"
+            self._tide_labels = ("low tide", "high tide")
+        else:
+            self._name_key = "nameFr"
+            self._tide_labels = ("marée basse", "marée haute")
         self.station_information = {}
         self.conditions = {}
+        # a session passed in by the caller is shared, so only close our own
+        self._session: Optional[ClientSession] = kwargs["session"]
+        self._owns_session = self._session is None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_closer: Optional[AsyncGenerator[None, None]] = None
+        self._id_lock: Optional[asyncio.Lock] = None
+        self._http_cache: Dict[Any, Tuple[Optional[str], Optional[str], bytes]] = {}
+        self._timeseries_codes: Optional[List[str]] = None
 
         if "station_id" in kwargs and kwargs["station_id"] is not None:
             self.station_id = kwargs["station_id"]
@@ -137,62 +414,115 @@ class TideData(object):
         else:
             self.coordinates = kwargs["coordinates"]
   
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """ Close the HTTP session shared by all API calls """
+
+        if self._session is not None and self._owns_session:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+                await self._session_closer.aclose()
+            else:
+                _discard_session(self._session, self._session_loop)
+        self._session = None
+        self._session_loop = None
+        self._session_closer = None
+
+    async def _get_session(self):
+        """ Return the HTTP session, creating it on first use """
+
+        if not self._owns_session and not self._session.closed:
+            return self._session
+
+        # a session cannot be used outside the event loop it was created in
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and self._owns_session:
+                _discard_session(self._session, self._session_loop)
+            self._session, self._session_closer = _open_session()
+            self._session_loop = loop
+            self._owns_session = True
+        return self._session
+
+    async def _get_data(self, url, params: Optional[Dict[str, str]] = None):
+        """ Retreive data using the shared HTTP session """
+
+        # time windows change on every call, so there is nothing to revalidate
+        if params and ("from" in params or "to" in params):
+            return await get_data(url, await self._get_session(), params)
+        return await get_data(url, await self._get_session(), params, self._http_cache)
+
+    async def _ensure_station_id(self):
+        """ Resolve the station id from the station code or coordinates once """
+
+        if self.station_id is not None:
+            return self.station_id
+        # created here rather than in __init__ so it binds to the running loop on Python < 3.10
+        if self._id_lock is None:
+            self._id_lock = asyncio.Lock()
+        async with self._id_lock:
+            if self.station_id is None:
+                if self.station_code is not None:
+                    stations = await self.stations(code=self.station_code)
+                    self.station_id = stations[0]["id"]
+                else:
+                    self.station_id = await closest_station(self.coordinates[0],self.coordinates[1],await self._get_session())
+        return self.station_id
+
+    async def _get_reference_data(self, url, params: Optional[Dict[str, str]] = None):
+        """ Retreive static reference data using the shared HTTP session """
+
+        return await get_reference_data(url, await self._get_session(), params)
+
     """ Static Methods """
 
     @staticmethod
     def construct_url(arg: str, **kwargs: str):
         """ Construct Integrated Water Level System API URL """
 
-        url = ENDPOINT + URLS[arg].format(**kwargs)
+        url = _URL_TEMPLATES[arg](kwargs)
         return url
 
     @staticmethod
     def validate_query_parameters(params, **kwargs: str):
         """ Validate query parameters """
 
-        timeseriescodes = ['wlo','wlp','wlp-hilo','wlp-bores','wcp-slack','wlf','wlf-spine','dvcf-spine']
         qparams = {}
-        for i in kwargs:
-            if i in params:
-                if (i == 'from' or i == 'to'):
-                    qparams[i] = kwargs[i].isoformat()[:-7]+'Z'
-                elif i == 'time-series-code':
-                    if kwargs[i] in timeseriescodes:
-                        qparams[i] = kwargs[i]
-                else:
-                    qparams[i] = kwargs[i]
+        for key, value in kwargs.items():
+            if key not in params:
+                continue
+            handler = _PARAM_HANDLERS.get(key)
+            if handler is not None:
+                value = handler(value)
+                if value is None:
+                    continue
+            qparams[key] = value
         return qparams
 
-    @staticmethod
-    def construct_query_parameters(**kwargs: str):
-        """ Construct Integrated Water Level System API Query Parameters """
-
-        query = ''
-        counter = 1
-        for i in kwargs:
-            if counter == 1:
-                query = '?' + i + '=' + kwargs[i]
-            else:
-                query = query + '&' + i + '=' + kwargs[i]
-            counter += 1
-        return query
-
     """ Internal Methods """
 
     async def set(self):
         """" Set the station information """
 
-        if self.station_id is None:
-            if self.station_code is not None:
-                self.station_information = await self.stations()
-                self.station_id = self.station_information["id"]
-            else:
-                self.station_id = await closest_station(self.coordinates[0],self.coordinates[1])
-        self.station_information = await self.station_metadata()
+        height_types_task = asyncio.ensure_future(self.height_types())
+        try:
+            self.station_information, height_types = await asyncio.gather(
+                self.station_metadata(), height_types_task
+            )
+        except BaseException:
+            height_types_task.cancel()
+            raise
         self.station_information["measurement"] = self.measurement
-        await self.update_heights_metadata()
-        await self.update_tidetable_metadata()
-        await self.update_timeseries_metadata()
+        await self.update_heights_metadata(height_types)
+        await asyncio.gather(
+            self.update_tidetable_metadata(),
+            self.update_timeseries_metadata(),
+        )
         self.station_code = self.station_information["code"]
 
     async def update(self):
@@ -200,8 +530,9 @@ class TideData(object):
 
         if self.station_id is None:
             await self.set()
-        self.conditions["conditions"] = await self.current_conditions()
-        self.conditions["hilo"] = await self.last_next_hilo()
+        self.conditions["conditions"], self.conditions["hilo"] = await asyncio.gather(
+            self.current_conditions(), self.last_next_hilo()
+        )
 
     async def current_conditions(self):
         """" Get the current tide conditions """
@@ -217,28 +548,21 @@ class TideData(object):
         event_previous = None           # previous event value
         event_next = None               # next event value
         event_date = None               # date of event just before current
-        low_value = 99                  # Set to high value that can never be reached
-        high_value = -99                # Set to low value that can never be reached
         for event in tide_data:
-            eventDate = datetime.strptime(event["eventDate"],"%Y-%m-%dT%H:%M:%SZ")
-            eventValue = event["value"]
-            if self.measurement == 'ft':
-                eventValue = round(event["value"] * M2FT,2)
-            # set high and low tide height values
-            if eventValue < low_value:
-                low_value = eventValue
-            if eventValue > high_value:
-                high_value = eventValue
-            # check for time compared to current
+            eventDate = datetime.fromisoformat(event["eventDate"][:-1])
+            # events are in time order, so the first one after now ends the scan
+            if eventDate > currentDT:
+                event_next = event["value"]
+                break
             if eventDate < currentDT:
-                event_previous = eventValue
+                event_previous = event["value"]
                 event_date = eventDate
-            if eventDate > currentDT and event_next == None:
-                event_next = eventValue
-                break
-        # Set conditions data       
+        if self.measurement == 'ft':
+            event_previous = round(event_previous * M2FT,2)
+            event_next = round(event_next * M2FT,2)
+        # Set conditions data
         conditions["value"] = event_previous
-        conditions["eventDate"] = event_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        conditions["eventDate"] = event_date.strftime(DATE_FORMAT)
         # figure out if tide is rising or falling
         if event_previous < event_next:
             conditions["status"] = "rising"
@@ -251,12 +575,7 @@ class TideData(object):
     async def last_next_hilo(self):
         """ Get the last and next high and low times """
 
-        lowtideLang = ["low tide","marée basse"]
-        hightideLang = ["high tide","marée haute"]
-        if self.language == "english":
-            lang = 0
-        else:
-            lang = 1
+        low_tide, high_tide = self._tide_labels
         currentDT = datetime.utcnow()
         parameters = {
             "time-series-code":"wlp-hilo",
@@ -267,14 +586,15 @@ class TideData(object):
         for event in tide_data:
             event.pop("qcFlagCode")
             event.pop("timeSeriesId")
-            if self.measurement == 'ft':
+        if self.measurement == 'ft':
+            for event in tide_data:
                 event["value"] = round(event["value"] * M2FT,2)
         if tide_data[0]["value"] < tide_data[1]["value"]:
-            tide_data[0]["event"] = lowtideLang[lang]
-            tide_data[1]['event'] = hightideLang[lang]
+            tide_data[0]["event"] = low_tide
+            tide_data[1]['event'] = high_tide
         else:
-            tide_data[0]["event"] = hightideLang[lang]
-            tide_data[1]["event"] = lowtideLang[lang]
+            tide_data[0]["event"] = high_tide
+            tide_data[1]["event"] = low_tide
 
         return tide_data
 
@@ -283,100 +603,93 @@ class TideData(object):
         """ Replace timeSeries phenomenonId with laquage name """
 
         timeSeries_Data = self.station_information["timeSeries"]
+        phenomenon_ids = list({timeSeries["phenomenonId"] for timeSeries in timeSeries_Data})
+        phenomena_by_id = dict(zip(
+            phenomenon_ids,
+            await asyncio.gather(*(self.phenomenon(phenomenonId) for phenomenonId in phenomenon_ids)),
+        ))
         for timeSeries in timeSeries_Data:
             timeSeries.pop("id")
-            if self.language == 'english':
-                timeSeries["name"] = timeSeries["nameEn"]
-            else:
-                timeSeries["name"] = timeSeries["nameFr"]
             timeSeries.pop("nameEn")
             timeSeries.pop("nameFr")
-            phenomena = await self.phenomenon(timeSeries["phenomenonId"]) 
-            if self.language == "english":
-                timeSeries["name"] = phenomena["nameEn"]
-            else:
-                timeSeries["name"] = phenomena["nameFr"]
-            timeSeries.pop("phenomenonId")
+            timeSeries["name"] = phenomena_by_id[timeSeries.pop("phenomenonId")][self._name_key]
+        self._timeseries_codes = None
 
     async def update_tidetable_metadata(self):
         """ Replace tideTableId with langauge name """
 
         tidetable = await self.tide_table(self.station_information["tideTableId"])
-        if self.language == "english":
-           self.station_information["tideTable"] = tidetable["nameEn"]
-        else:
-           self.station_information["tideTable"] = tidetable["nameFr"] 
+        self.station_information["tideTable"] = tidetable[self._name_key]
         self.station_information.pop("tideTableId")
 
 
-    async def update_heights_metadata(self):
+    async def update_heights_metadata(self, height_types=None):
         """ Replace heightTypeId with langauge name """
 
-        height_types = await self.height_types()
+        if height_types is None:
+            height_types = await self.height_types()
+        self._merge_height_types(height_types)
+
+    def _merge_height_types(self, height_types):
+        """ Join the station heights with the height types already retrieved """
+
+        height_types_by_id = {height_type["id"]: height_type for height_type in height_types}
         heights_data = self.station_information["heights"]
+        to_feet = self.measurement == 'ft'
         for height in heights_data:
-            heightTypeId = height["heightTypeId"]
-            for height_type in height_types:
-                if height_type["id"] == heightTypeId:
-                    height["code"] = height_type["code"]
-                    if self.language == 'english':
-                        height["name"] = height_type["nameEn"]
-                    else:
-                        height["name"] = height_type["nameFr"]
-                    height.pop("heightTypeId")
-            if self.measurement == 'ft':
+            height_type = height_types_by_id.get(height["heightTypeId"])
+            if height_type is not None:
+                height["code"] = height_type["code"]
+                height["name"] = height_type[self._name_key]
+                height.pop("heightTypeId")
+            if to_feet:
                 height["value"] = round(height["value"] * M2FT,2)
-        heights_data = sorted(heights_data, key = lambda height: (height["value"]), reverse = True)  
-        self.station_information["heights"] = heights_data            
+        heights_data = sorted(heights_data, key=itemgetter("value"), reverse=True)
+        self.station_information["heights"] = heights_data
 
     @property
     def timeSeries_codes(self):
         """ Return time station series codes """
 
-        ts_codes = []
-        for ts in self.station_information["timeSeries"]:
-            ts_codes.append(ts["code"])
+        if self._timeseries_codes is None:
+            self._timeseries_codes = [ts["code"] for ts in self.station_information["timeSeries"]]
 
-        return ts_codes
+        return list(self._timeseries_codes)
 
     @property
     def heights(self):
         """ Get the sorted heights in highest to lowest """
 
-        height_data = []
-        height = {}
-        for h in self.station_information["heights"]:
-            height["code"] = h["code"]
-            height["name"] = h["name"]
-            height["value"] = h["value"]
-            height_data.append(height.copy())
-
-        return height_data
+        # the heights are stored sorted, so only copy them for the caller
+        return [
+            {"code": h["code"], "name": h["name"], "value": h["value"]}
+            for h in self.station_information["heights"]
+        ]
 
     """ Integrated Water Level System API Endpoints """
 
     async def station_data(self, **kwargs: str):
         """ /api/v1/stations/{stationId}/data """
 
-        params = ['time-series-code','from','to']
+        params = STATION_DATA_PARAMS
         qparams = self.validate_query_parameters(params, **kwargs)
         url = self.construct_url(
             ENDPOINT_STATION_DATA,
-            stationId = self.station_id,
-        ) + self.construct_query_parameters(**qparams)
-        data = await get_data(url)
+            stationId = await self._ensure_station_id(),
+        )
+        data = await self._get_data(url, qparams)
 
         return data
 
     async def stations(self, **kwargs: str):
         """ /api/v1/stations """
 
-        params = ['code','chs-region-code','time-series-code']
+        params = STATIONS_PARAMS
         if self.station_code and kwargs.get('code') == None:
             kwargs['code'] = self.station_code
         qparams = self.validate_query_parameters(params, **kwargs)
-        url = ENDPOINT + ENDPOINT_STATIONS + self.construct_query_parameters(**qparams)
-        data = await get_data(url)
+        url = ENDPOINT + ENDPOINT_STATIONS
+        data = await self._get_data(url, qparams)
 
         return data
 
@@ -385,33 +698,30 @@ class TideData(object):
 
         url = self.construct_url(
             ENDPOINT_STATION,
-            stationId = self.station_id,
+            stationId = await self._ensure_station_id(),
         )
-        data = await get_data(url)
+        data = await self._get_data(url)
 
         return data
 
     async def station_metadata(self):
         """ /api/v1/stations/{stationId}/metadata """
 
-        # Find station summery from ID
-        if not self.station_id and self.coordinates:
-            self.station_id = await self.closest_station(*self.coordinates)
         url = self.construct_url(
             ENDPOINT_STATION_METADATA,
-            stationId = self.station_id,
+            stationId = await self._ensure_station_id(),
         )
-        data = await get_data(url)
+        data = await self._get_data(url)
 
         return data
 
     async def tide_tables(self, **kwargs: str):
         """ /api/v1/tide-tables """
 
-        params = ['type','parent-tide-table-id']
+        params = TIDE_TABLES_PARAMS
         qparams = self.validate_query_parameters(params, **kwargs)
-        url = ENDPOINT + ENDPOINT_TIDE_TABLES + self.construct_query_parameters(**qparams)
-        data = await get_data(url)
+        url = ENDPOINT + ENDPOINT_TIDE_TABLES
+        data = await self._get_reference_data(url, qparams)
 
         return data
 
@@ -422,7 +732,7 @@ class TideData(object):
             ENDPOINT_TIDE_TABLE,
             tideTableId = tideTableId,
         )
-        data = await get_data(url)
+        data = await self._get_reference_data(url)
 
         return data   
 
@@ -430,7 +740,7 @@ class TideData(object):
         """ /api/v1/phenomena """
 
         url = ENDPOINT + ENDPOINT_PHENOMENA
-        data = await get_data(url)
+        data = await self._get_reference_data(url)
 
         return data
 
@@ -441,20 +751,20 @@ class TideData(object):
             ENDPOINT_PHENOMENON,
             phenomenonId = phenomenonId,
         )
-        data = await get_data(url)
+        data = await self._get_reference_data(url)
 
         return data   
 
     async def station_monthly_mean(self, **kwargs: str):
         """ /api/v1/stations/{stationId}/stats/calculate-monthly-mean """
 
-        params = ['year','month']
+        params = MONTHLY_MEAN_PARAMS
         qparams = self.validate_query_parameters(params, **kwargs)
         url = self.construct_url(
             ENDPOINT_STATION_STATS_MONTHLY,
-            stationId = self._station_id,
-        ) + self.construct_query_parameters(**qparams)
-        data = await get_data(url)
+            stationId = await self._ensure_station_id(),
+        )
+        data = await self._get_data(url, qparams)
 
         return data
 
@@ -462,7 +772,7 @@ class TideData(object):
         """ /api/v1/"height-types """
 
         url = ENDPOINT + ENDPOINT_HEIGHT_TYPES
-        data = await get_data(url)
+        data = await cached_json(await self._get_session(), url)
 
         return data
 
@@ -473,7 +783,7 @@ class TideData(object):
             ENDPOINT_HEIGHT_TYPE,
             heightTypeId = heightTypeId,
         )
-        data = await get_data(url)
+        data = await self._get_data(url)
 
         return data
 
@@ -17,6 +17,7 @@ ENDPOINT_HEIGHT_TYPES: str = "height-types"
 ENDPOINT_HEIGHT_TYPE: str = "height-type"
 
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
 
 URLS: Dict[str, str] = {
     ENDPOINT_STATION_DATA: "stations/{stationId}/data",
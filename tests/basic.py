@@ -1,22 +1,24 @@
 import asyncio
 
-from chstides import TideData
+from chstides import TideData, close_session, get_session
 
 async def main():
 
-    tides = TideData(coordinates=(44.67,-63.60), measurement="ft") # Work
-    await tides.set()
-    print(tides.station_information)
+    # share the process-wide session so set() and update() reuse its connections
+    async with TideData(coordinates=(44.67,-63.60), measurement="ft", session=get_session()) as tides: # Work
+        await tides.set()
+        print(tides.station_information)
 
-    print("** Update **")
-    await tides.update()
-    print(tides.conditions)
+        print("** Update **")
+        # Call REST API alongside the update, since the two are independent
+        _, height_type = await asyncio.gather(
+            tides.update(),
+            tides.height_type(heightTypeId="5cec2eba3d0f4a04cc64d5d7"),
+        )
+        print(tides.conditions)
+        print(height_type)
 
-    # Call REST API 
-    print(await tides.height_type(heightTypeId="5cec2eba3d0f4a04cc64d5d7"))
+    await close_session()
 
 
-loop = asyncio.get_event_loop()
-loop.run_until_complete(main())
-loop.run_until_complete(asyncio.sleep(1))
-loop.close()
\ No newline at end of file
+asyncio.run(main())
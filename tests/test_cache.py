@@ -0,0 +1,177 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aiohttp import ClientError
+
+import chstides.chs_iwls as chs_iwls
+from chstides.cache import cached_json
+
+
+class StubResponse:
+    """ Minimal stand-in for an aiohttp response used as an async context manager """
+
+    def __init__(self, status=200, data=None, headers=None, content_type="application/json"):
+        self.status = status
+        self.content_type = content_type
+        self.headers = headers or {}
+        self._body = json.dumps(data).encode("utf-8") if data is not None else b""
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        # yield to the loop so concurrent callers overlap, as they would on the network
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class StubSession:
+    """ Records every GET and answers it with the next queued response """
+
+    closed = False
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None):
+        self.requests.append((url, params, dict(headers or {})))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def close(self):
+        self.closed = True
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class CachedJsonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp.name) / "stations.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ttl_hit_skips_the_request(self):
+        session = StubSession(StubResponse(data=[{"id": "a"}], headers={"ETag": '"v1"'}))
+        first = run(cached_json(session, "http://api/stations", self.cache_path))
+        second = run(cached_json(session, "http://api/stations", self.cache_path))
+
+        self.assertEqual(first, [{"id": "a"}])
+        self.assertEqual(second, [{"id": "a"}])
+        self.assertEqual(len(session.requests), 1)
+
+    def test_stale_copy_is_revalidated_with_304(self):
+        session = StubSession(
+            StubResponse(data=[{"id": "a"}], headers={"ETag": '"v1"', "Last-Modified": "Mon"}),
+            StubResponse(status=304),
+        )
+        run(cached_json(session, "http://api/stations", self.cache_path, ttl=0))
+        data = run(cached_json(session, "http://api/stations", self.cache_path, ttl=0))
+
+        self.assertEqual(data, [{"id": "a"}])
+        headers = session.requests[1][2]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Mon")
+
+    def test_error_response_is_not_cached(self):
+        session = StubSession(
+            StubResponse(status=503, data={"message": "Service Unavailable"}),
+            StubResponse(data=[{"id": "a"}]),
+        )
+        self.assertEqual(run(cached_json(session, "http://api/stations", self.cache_path)), '0')
+        self.assertFalse(self.cache_path.exists())
+        self.assertEqual(run(cached_json(session, "http://api/stations", self.cache_path)), [{"id": "a"}])
+
+    def test_stale_copy_is_used_when_the_api_is_unreachable(self):
+        session = StubSession(StubResponse(data=[{"id": "a"}]), ClientError("down"))
+        run(cached_json(session, "http://api/stations", self.cache_path, ttl=0))
+        data = run(cached_json(session, "http://api/stations", self.cache_path, ttl=0))
+
+        self.assertEqual(data, [{"id": "a"}])
+
+
+class GetDataTest(unittest.TestCase):
+
+    def setUp(self):
+        chs_iwls._REF_CACHE.clear()
+
+    def test_concurrent_requests_share_one_fetch(self):
+        session = StubSession(StubResponse(data={"code": "00490"}))
+
+        async def fetch_three():
+            return await asyncio.gather(*(
+                chs_iwls.get_data("http://api/stations/x", session) for _ in range(3)
+            ))
+
+        results = run(fetch_three())
+
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(results, [{"code": "00490"}] * 3)
+        results[0]["code"] = "changed"
+        self.assertEqual(results[1]["code"], "00490")
+
+    def test_error_response_is_not_stored_for_revalidation(self):
+        http_cache = {}
+        session = StubSession(StubResponse(status=500, data={"message": "error"}, headers={"ETag": '"e"'}))
+        run(chs_iwls.get_data("http://api/stations/x", session, http_cache=http_cache))
+
+        self.assertEqual(http_cache, {})
+
+    def test_reference_error_is_not_cached(self):
+        session = StubSession(
+            StubResponse(status=503, data={"message": "Service Unavailable"}),
+            StubResponse(data={"nameEn": "Water levels"}),
+        )
+        run(chs_iwls.get_reference_data("http://api/phenomena/p1", session))
+        data = run(chs_iwls.get_reference_data("http://api/phenomena/p1", session))
+
+        self.assertEqual(data, {"nameEn": "Water levels"})
+        self.assertEqual(len(session.requests), 2)
+
+
+class ClosestStationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmp.name})
+        self.env.start()
+        chs_iwls._STATIONS_SOA = None
+        chs_iwls._NEAREST_CACHE.clear()
+
+    def tearDown(self):
+        chs_iwls._STATIONS_SOA = None
+        chs_iwls._NEAREST_CACHE.clear()
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_picks_the_nearest_station(self):
+        stations = [
+            {"id": "vancouver", "latitude": 49.28, "longitude": -123.12},
+            {"id": "halifax", "latitude": 44.67, "longitude": -63.58},
+            {"id": "bedford", "latitude": 44.72, "longitude": -63.66},
+        ]
+        session = StubSession(StubResponse(data=stations))
+
+        self.assertEqual(run(chs_iwls.closest_station(44.66, -63.57, session)), "halifax")
+        self.assertEqual(run(chs_iwls.closest_station(44.71, -63.65, session)), "bedford")
+        self.assertEqual(run(chs_iwls.closest_station(49.0, -123.0, session)), "vancouver")
+        self.assertEqual(len(session.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+import chstides.chs_iwls as chs_iwls
+from chstides.chs_iwls import DATE_FORMAT, STATION_DATA_PARAMS
+from chstides import TideData
+
+from test_cache import StubResponse, StubSession, run
+
+STATION_ID = "5cebf1df3d0f4a073c4bbcbb"
+
+
+class SessionTest(unittest.TestCase):
+
+    def test_session_is_replaced_in_a_new_event_loop(self):
+        first = StubSession(StubResponse(data={"code": "00490"}))
+        second = StubSession(StubResponse(data={"code": "00490"}))
+        tides = TideData(station_id=STATION_ID)
+
+        with mock.patch.object(chs_iwls, "create_session", side_effect=[first, second]):
+            run(tides.station())
+            run(tides.station())
+
+        self.assertTrue(first.closed)
+        self.assertEqual(len(first.requests), 1)
+        self.assertEqual(len(second.requests), 1)
+
+
+class HeightsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tides = TideData(station_id=STATION_ID, measurement="ft")
+        self.tides.station_information = {"heights": [
+            {"heightTypeId": "h1", "value": 0.5},
+            {"heightTypeId": "h2", "value": 2.0},
+        ]}
+        self.tides._merge_height_types([
+            {"id": "h1", "code": "LAT", "nameEn": "Lowest Astronomical Tide"},
+            {"id": "h2", "code": "HAT", "nameEn": "Highest Astronomical Tide"},
+        ])
+
+    def test_heights_are_sorted_highest_first(self):
+        self.assertEqual(self.tides.heights, [
+            {"code": "HAT", "name": "Highest Astronomical Tide", "value": 6.56},
+            {"code": "LAT", "name": "Lowest Astronomical Tide", "value": 1.64},
+        ])
+
+    def test_changing_a_returned_height_does_not_change_the_next_read(self):
+        heights = self.tides.heights
+        heights[0]["value"] = 0
+        heights.pop()
+
+        self.assertEqual(self.tides.heights[0]["value"], 6.56)
+        self.assertEqual(len(self.tides.heights), 2)
+
+
+class QueryParametersTest(unittest.TestCase):
+
+    def test_whole_second_dates_keep_their_seconds(self):
+        qparams = TideData.validate_query_parameters(
+            STATION_DATA_PARAMS,
+            **{"from": datetime(2024, 1, 2, 3, 4, 5), "to": datetime(2024, 1, 2, 10, 4, 5, 123456)}
+        )
+
+        self.assertEqual(qparams, {"from": "2024-01-02T03:04:05Z", "to": "2024-01-02T10:04:05Z"})
+
+    def test_unknown_time_series_code_is_dropped(self):
+        params = TideData.validate_query_parameters(STATION_DATA_PARAMS, **{"time-series-code": "bogus"})
+        known = TideData.validate_query_parameters(STATION_DATA_PARAMS, **{"time-series-code": "wlp"})
+
+        self.assertEqual(params, {})
+        self.assertEqual(known, {"time-series-code": "wlp"})
+
+    def test_parameters_outside_the_endpoint_are_dropped(self):
+        qparams = TideData.validate_query_parameters(STATION_DATA_PARAMS, code="00490")
+
+        self.assertEqual(qparams, {})
+
+
+class CurrentConditionsTest(unittest.TestCase):
+
+    def conditions(self, values, measurement="m"):
+        """ Run current_conditions over events one hour apart, the last one an hour from now """
+
+        now = datetime.utcnow().replace(microsecond=0)
+        dates = [now + timedelta(hours=hour) for hour in range(2 - len(values), 2)]
+        series = [
+            {"eventDate": date.strftime(DATE_FORMAT), "value": value}
+            for date, value in zip(dates, values)
+        ]
+        session = StubSession(StubResponse(data=series))
+        tides = TideData(station_id=STATION_ID, measurement=measurement)
+        with mock.patch.object(chs_iwls, "create_session", return_value=session):
+            conditions = run(tides.current_conditions())
+        return conditions, dates[-2].strftime(DATE_FORMAT)
+
+    def test_rising_tide(self):
+        conditions, event_date = self.conditions([1.0, 1.2, 1.5])
+
+        self.assertEqual(conditions, {"value": 1.2, "eventDate": event_date, "status": "rising"})
+
+    def test_falling_tide_in_feet(self):
+        conditions, event_date = self.conditions([1.5, 1.2, 1.0], measurement="ft")
+
+        self.assertEqual(conditions, {"value": 3.94, "eventDate": event_date, "status": "falling"})
+
+
+if __name__ == "__main__":
+    unittest.main()